@@ -129,6 +129,84 @@ class FactorGraph:
         )
         self._register_factor_group(factor_group, name)
 
+    def add_factors(
+        self,
+        variable_names_for_factors: Sequence[List],
+        factor_configs_for_factors: Sequence[np.ndarray],
+        log_potentials_for_factors: Optional[Sequence[Optional[np.ndarray]]] = None,
+    ) -> None:
+        """Function to add multiple factors to the FactorGraph at once.
+
+        Factors sharing the same valid configurations are registered through a
+        single EnumerationFactorGroup, which makes adding many factors cheaper
+        than calling add_factor in a Python loop.
+
+        Args:
+            variable_names_for_factors: A list of lists of variable names, where each
+                inner list contains the connected variable names of one factor, as in
+                add_factor.
+            factor_configs_for_factors: A list containing the factor_configs array of
+                each factor, as in add_factor.
+            log_potentials_for_factors: Optional list containing the log_potentials
+                array of each factor, as in add_factor.
+                If None, it is assumed the log potentials are uniform 0 for all the
+                factors.
+
+        Raises:
+            ValueError: If the numbers of variable names, factor configs and log
+                potentials provided do not match.
+        """
+        num_factors = len(variable_names_for_factors)
+        if len(factor_configs_for_factors) != num_factors:
+            raise ValueError(
+                f"Got {num_factors} lists of variable names but "
+                f"{len(factor_configs_for_factors)} factor configs."
+            )
+
+        if log_potentials_for_factors is None:
+            log_potentials_for_factors = [None] * num_factors
+        elif len(log_potentials_for_factors) != num_factors:
+            raise ValueError(
+                f"Got {num_factors} lists of variable names but "
+                f"{len(log_potentials_for_factors)} log potentials."
+            )
+
+        factors_by_configs: OrderedDict[
+            Tuple[Tuple[int, ...], bytes], List
+        ] = collections.OrderedDict()
+        for variable_names, factor_configs, log_potentials in zip(
+            variable_names_for_factors,
+            factor_configs_for_factors,
+            log_potentials_for_factors,
+        ):
+            factors_by_configs.setdefault(
+                (factor_configs.shape, factor_configs.tobytes()), []
+            ).append((variable_names, factor_configs, log_potentials))
+
+        for factors in factors_by_configs.values():
+            factor_configs = factors[0][1]
+            if all(log_potentials is None for _, _, log_potentials in factors):
+                log_potentials = None
+            else:
+                log_potentials = np.stack(
+                    [
+                        np.zeros(factor_configs.shape[0])
+                        if log_potentials is None
+                        else log_potentials
+                        for _, _, log_potentials in factors
+                    ]
+                )
+
+            factor_group = groups.EnumerationFactorGroup(
+                self._variable_group,
+                variable_names_for_factors=[
+                    variable_names for variable_names, _, _ in factors
+                ],
+                factor_configs=factor_configs,
+                log_potentials=log_potentials,
+            )
+            self._register_factor_group(factor_group)
+
     def add_factor_group(self, factory: Callable, *args, **kwargs) -> None:
         """Add a factor group to the factor graph
 
@@ -795,6 +873,8 @@ def BP(
     Args:
         bp_state: Belief propagation state.
         num_iters: Number of belief propagation iterations.
+            The iterations run within a jax.lax.scan, so the size of the traced
+            computation (and hence the compile time) does not grow with num_iters.
         temperature: Temperature for loopy belief propagation.
             1.0 corresponds to sum-product, 0.0 corresponds to max-product.
 
@@ -0,0 +1,16 @@
+import os
+
+import jax
+
+# Persist compiled XLA executables across test runs, so repeated invocations
+# skip compilation for matching shapes. jax versions without the persistent
+# compilation cache options simply skip this.
+try:
+    jax.config.update(
+        "jax_compilation_cache_dir",
+        os.environ.get("JAX_CACHE", "/tmp/pgmax_jax_cache"),
+    )
+    jax.config.update("jax_persistent_cache_min_entry_size_bytes", 0)
+    jax.config.update("jax_persistent_cache_min_compile_time_secs", 0)
+except AttributeError:
+    pass
@@ -27,6 +27,34 @@ def test_factor_graph():
         fg.add_factor([0], np.arange(10)[:, None])
 
 
+def test_add_factors():
+    variable_group = groups.VariableDict(15, (0, 1))
+    fg = graph.FactorGraph(variable_group)
+    with pytest.raises(
+        ValueError,
+        match="Got 2 lists of variable names but 1 factor configs.",
+    ):
+        fg.add_factors([[0], [1]], [np.arange(15)[:, None]])
+
+    with pytest.raises(
+        ValueError,
+        match="Got 2 lists of variable names but 1 log potentials.",
+    ):
+        fg.add_factors(
+            [[0], [1]],
+            [np.arange(15)[:, None], np.arange(15)[:, None]],
+            [np.zeros(15)],
+        )
+
+    fg.add_factors(
+        [[0], [1]],
+        [np.arange(15)[:, None], np.arange(15)[:, None]],
+        [None, np.zeros(15)],
+    )
+    assert len(fg.factors) == 2
+    assert len(fg.factor_groups) == 1
+
+
 def test_bp_state():
     variable_group = groups.VariableDict(15, (0,))
     fg0 = graph.FactorGraph(variable_group)
@@ -0,0 +1,217 @@
+import functools
+
+import jax
+import numpy as np
+import pytest
+
+from pgmax.fg import graph, groups
+
+
+def _all_binary_rows(k):
+    """Returns an array of shape (2**k, k) enumerating all binary configurations
+    of k binary variables, via vectorized bit-unpacking.
+    """
+    return (
+        (np.arange(1 << k, dtype=np.uint8)[:, None] >> np.arange(k - 1, -1, -1)) & 1
+    ).astype(np.int64)
+
+
+@functools.lru_cache(maxsize=None)
+def _or_valid_configs(num_parents):
+    """Returns an immutable array of shape (2**num_parents, num_parents + 1)
+    enumerating the valid configurations of a logical OR gate with num_parents
+    binary parents. The children's state is the last one.
+    """
+    configs = _all_binary_rows(num_parents + 1)
+    valid_ON_configs = configs[
+        (configs[:, :-1].sum(axis=1) >= 1) & (configs[:, -1] == 1)
+    ]
+    # The all-OFF configuration followed by the valid ON configurations,
+    # written into a buffer preallocated at its known final size
+    valid_configs = np.empty((1 << num_parents, num_parents + 1), dtype=np.int64)
+    valid_configs[0] = 0
+    valid_configs[1:] = valid_ON_configs
+    valid_configs.setflags(write=False)
+    return valid_configs
+
+
+@functools.lru_cache(maxsize=None)
+def _and_valid_configs(num_parents):
+    """Returns an immutable array of shape (2**num_parents, num_parents + 1)
+    enumerating the valid configurations of a logical AND gate with num_parents
+    binary parents. The children's state is the last one.
+    """
+    configs = _all_binary_rows(num_parents + 1)
+    valid_OFF_configs = configs[
+        (configs[:, :-1].sum(axis=1) < num_parents) & (configs[:, -1] == 0)
+    ]
+    # The all-ON configuration followed by the valid OFF configurations,
+    # written into a buffer preallocated at its known final size
+    valid_configs = np.empty((1 << num_parents, num_parents + 1), dtype=np.int64)
+    valid_configs[0] = 1
+    valid_configs[1:] = valid_OFF_configs
+    valid_configs.setflags(write=False)
+    return valid_configs
+
+
+@functools.lru_cache(maxsize=None)
+def _nd_variable_array(num_states, shape):
+    """Returns a cached NDVariableArray, which is immutable after construction
+    and can safely be shared across FactorGraphs.
+    """
+    return groups.NDVariableArray(num_states=num_states, shape=shape)
+
+
+# graph.BP re-traces its BP computation for every new FactorGraph, so the
+# constructed graphs and their BP functions are cached and reused across test
+# parameters sharing the same gate, graph structure and temperature.
+_bp_functions_by_signature = {}
+
+
+@pytest.mark.parametrize(
+    "valid_configs_builder", [_or_valid_configs, _and_valid_configs], ids=["OR", "AND"]
+)
+@pytest.mark.parametrize("idx", range(10))
+def test_run_bp_with_logical_factors(valid_configs_builder, idx):
+    """Simultaneously test
+    (1) the support of EnumerationFactors enumerating the valid configurations
+    of logical OR and AND gates
+    (2) the agreement of the beliefs of two FactorGraphs created with the same
+    factors added in different orders, individually via add_factor or grouped
+    via add_factor_group.
+
+    Both FactorGraphs have the same structure: each factor connects a random
+    number of binary parents variables to a binary children variable, whose
+    state is the output of the logical gate applied to the parents' states.
+
+    The first FactorGraph contains the first half of the factors added
+    individually and the second half added via EnumerationFactorGroups, while
+    the second FactorGraph is built the other way around.
+
+    The seed iterations are independent, so they are exposed as parameters and
+    can be distributed across processes with pytest-xdist.
+    """
+    rng = np.random.default_rng(idx)
+    # Parameters
+    num_factors = rng.integers(3, 8)
+    num_parents = rng.integers(1, 6, num_factors)
+    num_parents_cumsum = np.empty(num_factors + 1, dtype=np.int64)
+    num_parents_cumsum[0] = 0
+    np.cumsum(num_parents, out=num_parents_cumsum[1:])
+
+    # Setting the temperature
+    if idx % 2 == 0:
+        # Max-product
+        temperature = 0.0
+    else:
+        temperature = rng.uniform(low=0.5, high=1.0)
+
+    signature = (
+        valid_configs_builder,
+        idx == 0,
+        num_factors,
+        tuple(num_parents),
+        temperature,
+    )
+    if signature not in _bp_functions_by_signature:
+        # The two graphs share the same cached variable groups
+        parents_variables = _nd_variable_array(2, (num_parents.sum(),))
+        children_variables = _nd_variable_array(2, (num_factors,))
+        fg1 = graph.FactorGraph(
+            variables=dict(parents=parents_variables, children=children_variables)
+        )
+        fg2 = graph.FactorGraph(
+            variables=dict(parents=parents_variables, children=children_variables)
+        )
+
+        # The parents' variable names are built once and sliced per factor,
+        # which is cheaper than a fresh list comprehension per factor
+        parents_variable_names = [
+            ("parents", idx2) for idx2 in range(num_parents_cumsum[-1])
+        ]
+
+        # For the first seed, all the individual factors are added to
+        # FactorGraph1 and all the grouped factors to FactorGraph2. For the
+        # other seeds, each graph receives the complementary halves of the
+        # factors from the two addition paths.
+        if idx == 0:
+            option1_factor_idxs_fg1 = range(num_factors)
+            option1_factor_idxs_fg2 = range(0)
+        else:
+            option1_factor_idxs_fg1 = range(num_factors // 2)
+            option1_factor_idxs_fg2 = range(num_factors // 2, num_factors)
+
+        def variable_names_for_factor(factor_idx):
+            return parents_variable_names[
+                num_parents_cumsum[factor_idx] : num_parents_cumsum[factor_idx + 1]
+            ] + [("children", factor_idx)]
+
+        # Option 1: add the individual factors, in a tight per-graph loop
+        for fg, factor_idxs in (
+            (fg1, option1_factor_idxs_fg1),
+            (fg2, option1_factor_idxs_fg2),
+        ):
+            for factor_idx in factor_idxs:
+                this_num_parents = num_parents[factor_idx]
+                valid_configs = valid_configs_builder(this_num_parents)
+                assert valid_configs.shape[0] == 2 ** this_num_parents
+                fg.add_factor(
+                    variable_names=variable_names_for_factor(factor_idx),
+                    factor_configs=valid_configs,
+                    log_potentials=np.zeros(valid_configs.shape[0]),
+                )
+
+        # Option 2: each graph receives the factors the other graph got
+        # individually, with a single bulk call which internally groups the
+        # factors sharing their valid configurations into
+        # EnumerationFactorGroups.
+        for fg, factor_idxs in (
+            (fg1, option1_factor_idxs_fg2),
+            (fg2, option1_factor_idxs_fg1),
+        ):
+            if len(factor_idxs) > 0:
+                fg.add_factors(
+                    [
+                        variable_names_for_factor(factor_idx)
+                        for factor_idx in factor_idxs
+                    ],
+                    [
+                        valid_configs_builder(num_parents[factor_idx])
+                        for factor_idx in factor_idxs
+                    ],
+                )
+
+        _bp_functions_by_signature[signature] = (
+            graph.BP(fg1.bp_state, 100, temperature),
+            graph.BP(fg2.bp_state, 100, temperature),
+        )
+
+    # Run inference
+    (run_bp1, _, get_beliefs1), (run_bp2, _, get_beliefs2) = (
+        _bp_functions_by_signature[signature]
+    )
+
+    # The evidence updates are generated directly on the device, avoiding a
+    # host-to-device transfer, and shared by the two BP runs.
+    key1, key2 = jax.random.split(jax.random.PRNGKey(idx))
+    evidence_updates = {
+        "parents": jax.random.gumbel(key1, (int(num_parents.sum()), 2)),
+        "children": jax.random.gumbel(key2, (int(num_factors), 2)),
+    }
+    # Both BP runs and both beliefs computations are dispatched without any
+    # intermediate host synchronization, so that JAX's asynchronous dispatch
+    # can overlap their executions. The comparisons below are the only
+    # points forcing a host transfer.
+    bp_arrays1 = run_bp1(evidence_updates=evidence_updates)
+    bp_arrays2 = run_bp2(evidence_updates=evidence_updates)
+    beliefs1 = get_beliefs1(bp_arrays1)
+    beliefs2 = get_beliefs2(bp_arrays2)
+
+    # Compare the beliefs of the two graphs in a single pass
+    diff = np.concatenate(
+        [
+            (beliefs1["children"] - beliefs2["children"]).ravel(),
+            (beliefs1["parents"] - beliefs2["parents"]).ravel(),
+        ]
+    )
+    assert np.max(np.abs(diff)) < 1e-4